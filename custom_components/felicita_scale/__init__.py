@@ -23,13 +23,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: FelicitaScaleConfigEntry
     coordinator = FelicitaScaleDataUpdateCoordinator(hass, address, entry)
     entry.runtime_data = coordinator
 
+    # No first refresh here: battery scales are usually asleep at startup, so
+    # connecting is left to advertisements. The callback is replayed with the
+    # last known advertisement, so a scale that is already awake still connects.
     # Register for Bluetooth advertisements to detect when device comes back online
     entry.async_on_unload(
         bluetooth.async_register_callback(
             hass,
             coordinator._async_handle_bluetooth_event,  # noqa: SLF001
-            {"address": address.upper()},
-            bluetooth.BluetoothScanningMode.ACTIVE,
+            coordinator.address_matcher,
+            bluetooth.BluetoothScanningMode.PASSIVE,
         )
     )
 
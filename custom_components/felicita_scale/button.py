@@ -5,9 +5,9 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import FelicitaScaleDataUpdateCoordinator
+from .entity import FelicitaScaleEntity
 from .models import FelicitaScaleConfigEntry
 
 
@@ -25,63 +25,51 @@ async def async_setup_entry(
     ])
 
 
-class FelicitaScaleTareButton(CoordinatorEntity[FelicitaScaleDataUpdateCoordinator], ButtonEntity):
-    """Representation of a Felicita Scale tare button."""
-
-    _attr_has_entity_name = True
+class FelicitaScaleBaseButton(FelicitaScaleEntity, ButtonEntity):
+    """Base class for Felicita Scale buttons."""
 
     def __init__(
         self,
         coordinator: FelicitaScaleDataUpdateCoordinator,
         config_entry: FelicitaScaleConfigEntry,
+        button_type: str,
+        name: str,
+        icon: str,
     ) -> None:
         """Initialize the button."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{config_entry.entry_id}_tare"
-        self._attr_name = "Tare"
-        self._attr_icon = "mdi:scale-balance"
-        
-        self._attr_device_info = coordinator.device_info
+        self._attr_unique_id = f"{config_entry.entry_id}_{button_type}"
+        self._attr_name = name
+        self._attr_icon = icon
+
+
+class FelicitaScaleTareButton(FelicitaScaleBaseButton):
+    """Representation of a Felicita Scale tare button."""
+
+    def __init__(
+        self,
+        coordinator: FelicitaScaleDataUpdateCoordinator,
+        config_entry: FelicitaScaleConfigEntry,
+    ) -> None:
+        """Initialize the tare button."""
+        super().__init__(coordinator, config_entry, "tare", "Tare", "mdi:scale-balance")
 
     async def async_press(self) -> None:
         """Press the button."""
         await self.coordinator.async_tare()
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.is_connected
-        )
-
 
-class FelicitaScaleTimerResetButton(CoordinatorEntity[FelicitaScaleDataUpdateCoordinator], ButtonEntity):
+class FelicitaScaleTimerResetButton(FelicitaScaleBaseButton):
     """Representation of a Felicita Scale timer reset button."""
 
-    _attr_has_entity_name = True
-
     def __init__(
         self,
         coordinator: FelicitaScaleDataUpdateCoordinator,
         config_entry: FelicitaScaleConfigEntry,
     ) -> None:
-        """Initialize the button."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{config_entry.entry_id}_timer_reset"
-        self._attr_name = "Reset Timer"
-        self._attr_icon = "mdi:timer-off"
-        
-        self._attr_device_info = coordinator.device_info
+        """Initialize the timer reset button."""
+        super().__init__(coordinator, config_entry, "timer_reset", "Reset Timer", "mdi:timer-off")
 
     async def async_press(self) -> None:
         """Press the button."""
         await self.coordinator.async_reset_timer()
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.is_connected
-        )
\ No newline at end of file
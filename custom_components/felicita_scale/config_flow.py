@@ -1,21 +1,41 @@
 """Config flow for Felicita Scale integration."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from typing import Any
 
-from bleak import BleakScanner
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.components import bluetooth
 from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DEVICE_NAME_PREFIXES, DOMAIN
+from .const import DEVICE_NAME_PREFIXES_LOWER, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long to wait for a new advertisement when nothing is cached yet
+DISCOVERY_TIMEOUT = 2.0
+
+# Separators and whitespace stripped from manually entered MAC addresses
+_MAC_DELETE = str.maketrans("", "", ":- \t\r\n")
+
+
+def _is_supported_device(service_info: bluetooth.BluetoothServiceInfoBleak) -> bool:
+    """Check if this is a supported Felicita scale device."""
+    # The advertised service is the generic HM-10 serial UUID shared by many
+    # BLE devices, only the name identifies a Felicita
+    return _has_supported_name(service_info.name)
+
+
+def _has_supported_name(name: str | None) -> bool:
+    """Check if the advertised name matches a Felicita scale."""
+    return bool(name) and name.lower().startswith(DEVICE_NAME_PREFIXES_LOWER)
+
 
 class FelicitaScaleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Felicita Scale."""
@@ -33,7 +53,7 @@ class FelicitaScaleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle the bluetooth discovery step."""
         # Check if this is actually a supported Felicita scale device
-        if not self._is_supported_device(discovery_info.name, discovery_info.address):
+        if not _is_supported_device(discovery_info):
             return self.async_abort(reason="not_supported")
 
         await self.async_set_unique_id(discovery_info.address.upper())
@@ -113,23 +133,13 @@ class FelicitaScaleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovered_devices = {}
 
         try:
-            # First try to get devices from Bluetooth integration
+            # Use the devices already seen by the Bluetooth integration
             for service_info in bluetooth.async_discovered_service_info(self.hass):
-                if self._is_supported_device(service_info.name, service_info.address):
-                    name = service_info.name or service_info.address
-                    self._discovered_devices[service_info.address.upper()] = (
-                        f"{name} ({service_info.address})"
-                    )
+                self._async_add_discovered_device(service_info)
 
-            # If no devices found, try active scanning
+            # If no devices found, briefly wait for a new advertisement
             if not self._discovered_devices:
-                devices = await BleakScanner.discover(timeout=10.0)
-                for device in devices:
-                    if self._is_supported_device(device.name, device.address):
-                        name = device.name or device.address
-                        self._discovered_devices[device.address.upper()] = (
-                            f"{name} ({device.address})"
-                        )
+                await self._async_wait_for_advertisement()
 
         except Exception as err:
             _LOGGER.error("Error discovering scales: %s", err)
@@ -137,13 +147,49 @@ class FelicitaScaleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Add manual entry option
         self._discovered_devices["manual"] = "Enter address manually"
 
-    def _is_supported_device(self, name: str | None, address: str) -> bool:
-        """Check if this is a supported Felicita scale device."""
-        if not name:
+    async def _async_wait_for_advertisement(self) -> None:
+        """Wait until a supported scale advertises or the timeout expires."""
+        # Without a connectable scanner no advertisement can arrive
+        if not bluetooth.async_scanner_count(self.hass, connectable=True):
+            return
+
+        found = asyncio.Event()
+
+        @callback
+        def _async_handle_advertisement(
+            service_info: bluetooth.BluetoothServiceInfoBleak,
+            change: bluetooth.BluetoothChange,
+        ) -> None:
+            if self._async_add_discovered_device(service_info):
+                found.set()
+
+        # No matcher, the same _is_supported_device rule decides what is a
+        # scale so devices found only by name are picked up as well
+        unregister = bluetooth.async_register_callback(
+            self.hass,
+            _async_handle_advertisement,
+            None,
+            bluetooth.BluetoothScanningMode.ACTIVE,
+        )
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(found.wait(), DISCOVERY_TIMEOUT)
+        finally:
+            unregister()
+
+    @callback
+    def _async_add_discovered_device(
+        self, service_info: bluetooth.BluetoothServiceInfoBleak
+    ) -> bool:
+        """Add a supported scale to the discovered devices."""
+        if not _is_supported_device(service_info):
             return False
 
-        name_lower = name.lower()
-        return any(name_lower.startswith(prefix.lower()) for prefix in DEVICE_NAME_PREFIXES)
+        name = service_info.name or service_info.address
+        self._discovered_devices[service_info.address.upper()] = (
+            f"{name} ({service_info.address})"
+        )
+        return True
 
     async def async_step_manual(
         self, user_input: dict[str, Any] | None = None
@@ -153,18 +199,19 @@ class FelicitaScaleConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                address = user_input[CONF_ADDRESS].strip().upper()
-                
                 # Remove common separators
-                cleaned_address = address.replace(":", "").replace("-", "").replace(" ", "")
-                
+                cleaned_address = user_input[CONF_ADDRESS].upper().translate(_MAC_DELETE)
+
                 # Validate MAC address format
                 if len(cleaned_address) != 12 or not all(c in "0123456789ABCDEF" for c in cleaned_address):
                     errors[CONF_ADDRESS] = "invalid_address"
                 else:
                     # Format as proper MAC address
-                    formatted_address = ":".join([cleaned_address[i:i+2] for i in range(0, 12, 2)])
-                    
+                    formatted_address = (
+                        f"{cleaned_address[0:2]}:{cleaned_address[2:4]}:{cleaned_address[4:6]}:"
+                        f"{cleaned_address[6:8]}:{cleaned_address[8:10]}:{cleaned_address[10:12]}"
+                    )
+
                     await self.async_set_unique_id(formatted_address)
                     self._abort_if_unique_id_configured()
 
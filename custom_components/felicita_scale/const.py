@@ -8,13 +8,14 @@ CHARACTERISTIC_UUID = "0000ffe1-0000-1000-8000-00805f9b34fb"
 
 # Device name prefixes for auto-discovery
 DEVICE_NAME_PREFIXES = ["FELICITA"]
+DEVICE_NAME_PREFIXES_LOWER = tuple(prefix.lower() for prefix in DEVICE_NAME_PREFIXES)
 
-# Felicita command constants
-COMMAND_START_TIMER = 0x52
-COMMAND_STOP_TIMER = 0x53
-COMMAND_RESET_TIMER = 0x43
-COMMAND_TOGGLE_TIMER = 0x42
-COMMAND_TOGGLE_PRECISION = 0x44
-COMMAND_TARE = 0x54
-COMMAND_TOGGLE_UNIT = 0x55
+# Felicita command packets, each written to the characteristic as-is
+COMMAND_START_TIMER = b"\x52"
+COMMAND_STOP_TIMER = b"\x53"
+COMMAND_RESET_TIMER = b"\x43"
+COMMAND_TOGGLE_TIMER = b"\x42"
+COMMAND_TOGGLE_PRECISION = b"\x44"
+COMMAND_TARE = b"\x54"
+COMMAND_TOGGLE_UNIT = b"\x55"
 
@@ -5,16 +5,19 @@ import asyncio
 import contextlib
 from datetime import datetime
 import logging
-from typing import TYPE_CHECKING, Any
+import re
+import struct
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from bleak import BleakError
-from bleak.backends.device import BLEDevice
 from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -37,6 +40,7 @@ _LOGGER = logging.getLogger(__name__)
 
 # Felicita protocol constants
 PACKET_LENGTH = 18  # Felicita uses 18-byte packets
+SIGN_BYTE_INDEX = 2  # '+' or '-' right before the weight digits
 WEIGHT_BYTES_START = 3  # Weight data starts at byte 3
 WEIGHT_BYTES_END = 9    # Weight data ends at byte 9
 UNIT_BYTES_START = 9    # Unit data at bytes 9-11
@@ -50,6 +54,81 @@ MAX_BATTERY_LEVEL = 158
 # Weight validation limits
 MAX_WEIGHT_GRAMS = 5000  # 5kg in grams
 
+# Connection errors that are expected while a battery-powered scale sleeps
+_EXPECTED_ERROR_RE = re.compile(
+    "no backend with an available connection slot"
+    "|device is no longer reachable"
+    "|out of connection slots"
+    "|device disconnected"
+    "|not connected",
+    re.IGNORECASE,
+)
+
+# After publishing, further changes within this window are published as one update
+PUBLISH_INTERVAL = 0.1
+
+# Reconnect backoff limits in seconds
+RECONNECT_BACKOFF_MIN = 1.0
+RECONNECT_BACKOFF_MAX = 60.0
+
+# Exact mass conversion factors (same as Home Assistant's MassConverter)
+_KG_TO_G = 1000.0
+_LB_TO_G = 453.59237
+_OZ_TO_G = _LB_TO_G / 16
+
+# Grams per unit reported by the scale
+_GRAMS_PER_UNIT = {
+    "g": 1.0,
+    "kg": _KG_TO_G,
+    "lb": _LB_TO_G,
+    "oz": _OZ_TO_G,
+}
+
+# Whole packet layout (sign, weight, unit and battery), read in one unpack_from call
+_PACKET_STRUCT = struct.Struct(
+    f"{SIGN_BYTE_INDEX}x"
+    "B"
+    f"{WEIGHT_BYTES_END - WEIGHT_BYTES_START}s"
+    f"{UNIT_BYTES_END - UNIT_BYTES_START}s"
+    f"{BATTERY_BYTE_INDEX - UNIT_BYTES_END}x"
+    "B"
+    f"{PACKET_LENGTH - BATTERY_BYTE_INDEX - 1}x"
+)
+
+# Scale unit, raw value divisor and grams per raw count keyed by the unit
+# field, every casing is listed so packets need no lower() call
+_GRAMS_UNIT = ("g", 100.0, _GRAMS_PER_UNIT["g"] / 100.0)  # "000640" -> 6.40 g
+_OUNCES_UNIT = ("oz", 10000.0, _GRAMS_PER_UNIT["oz"] / 10000.0)  # "020140" -> 2.014 oz
+_UNIT_BY_FIELD = dict.fromkeys((b"oz", b"Oz", b"oZ", b"OZ"), _OUNCES_UNIT)
+
+# Weight multiplier keyed by the sign byte, anything else is positive
+_SIGN_BY_BYTE = {ord("-"): -1.0}
+
+
+def _calculate_battery_percentage(battery_byte: int) -> int:
+    """Calculate battery percentage from Felicita protocol."""
+    if battery_byte < MIN_BATTERY_LEVEL:
+        return 0
+    elif battery_byte > MAX_BATTERY_LEVEL:
+        return 100
+    else:
+        # Calculate percentage within the known range
+        percentage = ((battery_byte - MIN_BATTERY_LEVEL) / (MAX_BATTERY_LEVEL - MIN_BATTERY_LEVEL)) * 100
+        return round(percentage)
+
+
+# Battery percentage for every possible battery byte, indexed per packet
+_BATTERY_PERCENTAGE = bytes(_calculate_battery_percentage(level) for level in range(256))
+
+
+class _DecodedPacket(NamedTuple):
+    """Fields decoded from a single Felicita notification."""
+
+    weight: float  # Normalized to grams
+    unit: str  # Scale's native unit
+    raw_weight: float  # Weight in native unit
+    battery_level: int
+
 
 class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData]):
     """Class to manage fetching data from the Felicita Scale."""
@@ -62,20 +141,42 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
     ) -> None:
         """Initialize."""
         self.address = address.upper()
+        self.address_lower = address.lower()
+        self.address_matcher: bluetooth.BluetoothCallbackMatcher = {"address": self.address}
         self._config_entry = config_entry
+        self._device_name = config_entry.title or "Felicita Scale"
+        self._device_info: dict[str, Any] = {
+            "identifiers": {(DOMAIN, self.address)},
+            "name": self._device_name,
+            "manufacturer": "Felicita",
+            "model": "Scale",
+            "sw_version": "1.0",
+            "connections": {("bluetooth", self.address_lower)},
+        }
         self._client: BleakClientWithServiceCache | None = None
-        self._ble_device: BLEDevice | None = None
         self._connect_lock = asyncio.Lock()
         self._notification_enabled = False
+        self._write_response = True
         self._unavailable_logged = False
         self._connection_attempts = 0
-        self._last_successful_connection = None
+        self._last_successful_connection: str | None = None
+        self._last_successful_connection_mono: float | None = None
         self._total_disconnections = 0
-        self._weight_history = []
         self._stability_count = 4
+        self._last_stable_weight: float | None = None
+        self._identical_count = 0
         self._reconnect_task: asyncio.Task | None = None
+        self._reconnect_unsub: CALLBACK_TYPE | None = None
+        self._reconnect_backoff = 0.0
         self._ha_started = False
         self._pending_reconnect = False
+        self._pending_update: asyncio.TimerHandle | None = None
+        self._publish_pending = False
+        self._last_payload: bytes | None = None
+
+        # The scale does not report these, track what was last commanded
+        self.timer_running = False
+        self.precision_mode = False
 
         super().__init__(
             hass,
@@ -84,6 +185,8 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
             update_interval=None,
             config_entry=config_entry,
         )
+        # Single empty reading until the scale sends data
+        self.data = FelicitaScaleData()
 
         self._bluetooth_callback_unload = None
 
@@ -105,19 +208,12 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information for all entities."""
-        return {
-            "identifiers": {(DOMAIN, self.address)},
-            "name": self._config_entry.title or "Felicita Scale",
-            "manufacturer": "Felicita",
-            "model": "Scale",
-            "sw_version": "1.0",
-            "connections": {("bluetooth", self.address.lower())},
-        }
+        return self._device_info
 
     @property
     def device_name(self) -> str:
         """Return the device name for entity naming."""
-        return self.device_info["name"]
+        return self._device_name
 
     def get_entity_name(self, entity_type: str) -> str:
         """Generate entity name with device prefix."""
@@ -129,14 +225,10 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
         return {
             "connection_attempts": self._connection_attempts,
             "total_disconnections": self._total_disconnections,
-            "last_successful_connection": (
-                self._last_successful_connection.isoformat()
-                if self._last_successful_connection
-                else None
-            ),
+            "last_successful_connection": self._last_successful_connection,
             "current_connection_duration": (
-                (datetime.now() - self._last_successful_connection).total_seconds()
-                if self._last_successful_connection and self.is_connected
+                time.monotonic() - self._last_successful_connection_mono
+                if self._last_successful_connection_mono is not None and self.is_connected
                 else None
             ),
         }
@@ -148,7 +240,7 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
         if self._pending_reconnect:
             _LOGGER.info("HA started, processing pending reconnection")
             self._pending_reconnect = False
-            self._reconnect_task = self.hass.async_create_task(self._async_reconnect())
+            self._schedule_reconnect()
 
     @callback
     def _async_handle_bluetooth_event(
@@ -157,27 +249,50 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
         change: bluetooth.BluetoothChange,
     ) -> None:
         """Handle Bluetooth events."""
-        _LOGGER.debug("Bluetooth event received: change=%s, address=%s, rssi=%s",
-                     change, service_info.address, getattr(service_info, 'rssi', 'N/A'))
-        if change == bluetooth.BluetoothChange.ADVERTISEMENT:
-            self._ble_device = service_info.device
-            if not self._client or not self._client.is_connected:
-                # Cancel any ongoing reconnection attempt
-                if self._reconnect_task and not self._reconnect_task.done():
-                    self._reconnect_task.cancel()
-
-                if self._ha_started:
-                    # HA has started, safe to reconnect immediately
-                    _LOGGER.info("Scale detected, attempting reconnection")
-                    self._reconnect_task = self.hass.async_create_task(self._async_reconnect())
-                else:
-                    # HA still starting up, defer reconnection
-                    _LOGGER.info("Scale detected during startup, deferring reconnection")
-                    self._pending_reconnect = True
+        if change != bluetooth.BluetoothChange.ADVERTISEMENT:
+            return
+        if self._client and self._client.is_connected:
+            return
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Bluetooth event received: change=%s, address=%s, rssi=%s",
+                change, service_info.address, service_info.rssi,
+            )
+        if self._ha_started:
+            # HA has started, safe to reconnect
+            self._schedule_reconnect()
+        elif not self._pending_reconnect:
+            # HA still starting up, defer reconnection
+            _LOGGER.info("Scale detected during startup, deferring reconnection")
+            self._pending_reconnect = True
+
+    @callback
+    def _schedule_reconnect(self) -> None:
+        """Schedule a reconnection attempt with exponential backoff."""
+        if self._reconnect_unsub or (
+            self._reconnect_task and not self._reconnect_task.done()
+        ):
+            return
+
+        delay = self._reconnect_backoff
+        self._reconnect_backoff = min(
+            max(delay * 2, RECONNECT_BACKOFF_MIN), RECONNECT_BACKOFF_MAX
+        )
+        _LOGGER.debug("Scale detected, attempting reconnection in %.1fs", delay)
+        self._reconnect_unsub = async_call_later(
+            self.hass, delay, self._async_start_reconnect
+        )
+
+    @callback
+    def _async_start_reconnect(self, _now: datetime) -> None:
+        """Start the scheduled reconnection attempt."""
+        self._reconnect_unsub = None
+        self._reconnect_task = self.hass.async_create_task(self._async_reconnect())
 
     async def _async_update_data(self) -> FelicitaScaleData:
         """Return current data - all updates are reactive via Bluetooth notifications."""
-        return self.data or FelicitaScaleData()
+        return self.data
 
     async def _ensure_connected(self) -> None:
         """Ensure we have a connection to the scale."""
@@ -187,13 +302,12 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
 
             _LOGGER.debug("Connecting to Felicita Scale at %s", self.address)
 
-            # Get BLE device
-            if not self._ble_device:
-                self._ble_device = bluetooth.async_ble_device_from_address(
-                    self.hass, self.address, connectable=True
-                )
+            # Get the latest BLE device known to the Bluetooth integration
+            ble_device = bluetooth.async_ble_device_from_address(
+                self.hass, self.address, connectable=True
+            )
 
-            if not self._ble_device:
+            if not ble_device:
                 raise UpdateFailed(f"Could not find device with address {self.address}")
 
             # Connect to device using bleak-retry-connector
@@ -201,35 +315,32 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
                 self._connection_attempts += 1
                 self._client = await establish_connection(
                     BleakClientWithServiceCache,
-                    self._ble_device,
+                    ble_device,
                     self.address,
                     disconnected_callback=self._on_disconnect,
                 )
 
                 await self._setup_notifications()
 
-                self._last_successful_connection = datetime.now()
-
-                if not self._unavailable_logged:
+                # Wall clock for display, monotonic clock for durations
+                self._last_successful_connection = datetime.now().isoformat()
+                self._last_successful_connection_mono = time.monotonic()
+                self._reconnect_backoff = 0.0
+                # Let entities refresh their cached availability
+                self.async_update_listeners()
+
+                was_unavailable = self._unavailable_logged
+                self._unavailable_logged = False
+                if was_unavailable:
+                    _LOGGER.info("Felicita Scale is back online (attempt %d)",
+                                self._connection_attempts)
+                else:
                     _LOGGER.info("Successfully connected to Felicita Scale (attempt %d)",
                                 self._connection_attempts)
 
-                if self._unavailable_logged:
-                    _LOGGER.info("Felicita Scale is back online")
-                    self._unavailable_logged = False
-
             except (TimeoutError, BleakError) as err:
-                error_msg = str(err).lower()
-                expected_errors = {
-                    "no backend with an available connection slot",
-                    "device is no longer reachable", 
-                    "out of connection slots",
-                    "device disconnected",
-                    "not connected"
-                }
-                
-                is_expected_error = any(phrase in error_msg for phrase in expected_errors)
-                
+                is_expected_error = _EXPECTED_ERROR_RE.search(str(err)) is not None
+
                 if not self._unavailable_logged:
                     if is_expected_error:
                         _LOGGER.info("Device not reachable (expected for battery-powered scales): %s", err)
@@ -249,7 +360,19 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
             self._notification_enabled = True
             _LOGGER.debug("Notifications enabled for characteristic %s", CHARACTERISTIC_UUID)
 
+            # Commands need no acknowledgement, skip the ATT write response
+            # round trip whenever the characteristic allows it
+            characteristic = self._client.services.get_characteristic(CHARACTERISTIC_UUID)
+            self._write_response = (
+                characteristic is None
+                or "write-without-response" not in characteristic.properties
+            )
+
         except BleakError as err:
+            # Cached services may be stale, resolve them again on reconnect
+            if self._client:
+                with contextlib.suppress(BleakError):
+                    await self._client.clear_cache()
             _LOGGER.error("Failed to enable notifications: %s", err)
             raise UpdateFailed(f"Failed to enable notifications: {err}") from err
 
@@ -258,63 +381,101 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
         if not data:
             return
 
-        _LOGGER.debug("Received notification data: %s", data.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received notification data: %s", data.hex(" "))
+
+        # Repeated packets carry the same reading, they only advance stability.
+        # Comparing the bytearray against bytes needs no copy.
+        if data == self._last_payload:
+            if self._update_stability(self.data.weight):
+                self._publish_now()
+            return
 
         try:
-            weight_data = self._decode_weight_bytes(data)
-            if weight_data:
-                if not self.data:
-                    self.data = FelicitaScaleData()
+            decoded = self._decode_weight_bytes(data)
+            if decoded:
+                self._last_payload = bytes(data)
+                previous = (
+                    self.data.weight,
+                    self.data.unit,
+                    self.data.battery_level,
+                    self.data.is_stable,
+                )
 
                 # Update all weight-related fields
-                new_weight = weight_data["weight"]  # Normalized to grams
+                new_weight = decoded.weight
                 self.data.weight = new_weight
-                self.data.unit = weight_data["unit"]  # Scale's native unit
-                self.data.raw_weight = weight_data["raw_weight"]  # Weight in native unit
-                self.data.last_measurement = datetime.now()
+                self.data.unit = decoded.unit
+                self.data.raw_weight = decoded.raw_weight
                 
                 # Calculate stability based on consecutive identical readings
-                self.data.is_stable = self._calculate_stability(new_weight)
+                became_stable = self._update_stability(new_weight)
+
+                self.data.battery_level = decoded.battery_level
+
+                # Publish a settled reading right away, coalesce the rest and
+                # skip packets that changed nothing entities show
+                if became_stable:
+                    self._publish_now()
+                elif previous != (
+                    new_weight,
+                    decoded.unit,
+                    decoded.battery_level,
+                    self.data.is_stable,
+                ):
+                    self._schedule_publish()
 
-                # Update battery level if available
-                if "battery_level" in weight_data:
-                    self.data.battery_level = weight_data["battery_level"]
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.error("Error processing notification: %s", err)
 
 
-                # Notify Home Assistant of the update
-                self.async_set_updated_data(self.data)
+    def _update_stability(self, weight: float) -> bool:
+        """Update the stability flag, return True if the reading just settled."""
+        was_stable = self.data.is_stable
+        self.data.is_stable = self._calculate_stability(weight)
+        return self.data.is_stable and not was_stable
 
-        except (KeyError, TypeError, ValueError) as err:
-            _LOGGER.error("Error processing notification: %s", err)
+    @callback
+    def _schedule_publish(self) -> None:
+        """Publish right away, or once the current cooldown window ends."""
+        if self._pending_update is not None:
+            self._publish_pending = True
+            return
+        self._push_update()
+        self._pending_update = self.hass.loop.call_later(
+            PUBLISH_INTERVAL, self._flush_pending
+        )
 
+    @callback
+    def _flush_pending(self) -> None:
+        """Publish the reading accumulated during the cooldown window."""
+        self._pending_update = None
+        if self._publish_pending:
+            self._publish_pending = False
+            self._schedule_publish()
 
-    def _validate_packet(self, data: bytearray) -> bool:
-        """Validate Felicita packet structure."""
-        if len(data) != PACKET_LENGTH:
-            _LOGGER.debug("Invalid packet length: %d bytes (expected %d)", len(data), PACKET_LENGTH)
-            return False
-        return True
+    @callback
+    def _publish_now(self) -> None:
+        """Notify Home Assistant of the latest reading."""
+        self._cancel_pending_publish()
+        self._push_update()
 
-    def _extract_unit_from_bytes(self, data: bytearray) -> str:
-        """Extract unit from bytes 9-11 using Felicita protocol."""
-        if len(data) < UNIT_BYTES_END:
-            return "g"  # Default to grams
-        
-        try:
-            # Extract unit bytes and decode as text
-            unit_bytes = data[UNIT_BYTES_START:UNIT_BYTES_END]
-            unit_str = bytes(unit_bytes).decode('utf-8', errors='ignore').strip()
-            
-            # Map to standard units
-            if 'g' in unit_str.lower():
-                return "g"
-            elif 'oz' in unit_str.lower():
-                return "oz"
-            else:
-                return "g"  # Default to grams
-                
-        except (UnicodeDecodeError, IndexError):
-            return "g"  # Default to grams
+    @callback
+    def _push_update(self) -> None:
+        """Stamp the reading and hand it to the listeners."""
+        data = self.data
+        data.set_last_measurement(datetime.now())
+        if data.weight is not None:
+            data.weight_display = round(data.weight, 1)
+        self.async_set_updated_data(data)
+
+    @callback
+    def _cancel_pending_publish(self) -> None:
+        """Cancel a scheduled coalesced update."""
+        self._publish_pending = False
+        if self._pending_update is not None:
+            self._pending_update.cancel()
+            self._pending_update = None
 
     def _calculate_stability(self, weight: float) -> bool:
         """Calculate if weight is stable based on consecutive identical readings."""
@@ -323,113 +484,70 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
         
         # Zero weight is never considered stable (tared/empty scale)
         if rounded_weight == 0.0:
-            self._weight_history.clear()  # Reset history when at zero
+            # Reset the run when at zero
+            self._last_stable_weight = None
+            self._identical_count = 0
             return False
         
-        # Add to history
-        self._weight_history.append(rounded_weight)
-        
-        # Keep only the last stability_count readings
-        if len(self._weight_history) > self._stability_count:
-            self._weight_history.pop(0)
-        
-        # Check if we have enough readings and they're all the same
-        if len(self._weight_history) >= self._stability_count:
-            return all(w == self._weight_history[0] for w in self._weight_history)
-        
-        return False
-
-    def _calculate_battery_percentage(self, battery_byte: int) -> int:
-        """Calculate battery percentage from Felicita protocol."""
-        if battery_byte < MIN_BATTERY_LEVEL:
-            return 0
-        elif battery_byte > MAX_BATTERY_LEVEL:
-            return 100
+        # Count consecutive identical readings
+        if rounded_weight == self._last_stable_weight:
+            self._identical_count += 1
         else:
-            # Calculate percentage within the known range
-            percentage = ((battery_byte - MIN_BATTERY_LEVEL) / (MAX_BATTERY_LEVEL - MIN_BATTERY_LEVEL)) * 100
-            return round(percentage)
-    
-    def _convert_to_grams(self, weight: float, unit: str) -> float:
-        """Convert weight from native unit to grams."""
-        conversion_factors = {
-            "g": 1.0,
-            "kg": 1000.0,
-            "lb": 453.592,
-            "oz": 28.3495
-        }
+            self._last_stable_weight = rounded_weight
+            self._identical_count = 1
         
-        if unit in conversion_factors:
-            return weight * conversion_factors[unit]
-        else:
-            return weight
+        return self._identical_count >= self._stability_count
 
-    def _decode_weight_bytes(self, data: bytearray) -> dict[str, Any] | None:
+    def _decode_weight_bytes(self, data: bytearray) -> _DecodedPacket | None:
         """Decode weight from characteristic data using Felicita protocol."""
-        if not self._validate_packet(data):
+        if len(data) != PACKET_LENGTH:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Invalid packet length: %d bytes (expected %d)", len(data), PACKET_LENGTH)
             return None
 
         try:
-            _LOGGER.debug("Raw packet: %s", ' '.join(f'{b:02x}' for b in data))
-            
-            # Extract weight from bytes 3-9 as ASCII values (Felicita protocol)
-            weight_bytes = data[WEIGHT_BYTES_START:WEIGHT_BYTES_END]
+            # Extract sign (byte 2), weight (bytes 3-9, ASCII), unit (bytes 9-11)
+            # and battery (byte 15)
+            sign_byte, weight_bytes, unit_field, battery_byte = (
+                _PACKET_STRUCT.unpack_from(data)
+            )
             
-            # Convert ASCII bytes directly to string, then to number
-            weight_str = ""
-            weight_digits = ""
+            # int() parses the ASCII digits directly, drop packets with a
+            # corrupt field quietly since the scale keeps streaming
             try:
-                weight_str = weight_bytes.decode('ascii', errors='ignore')
-                # Remove any non-digit characters
-                weight_digits = ''.join(c for c in weight_str if c.isdigit())
-                    
-            except (UnicodeDecodeError, ValueError):
-                _LOGGER.warning("Failed to decode weight from bytes: %s", weight_bytes.hex())
-                weight_digits = ""
-            
-            # Extract unit from bytes 9-11 FIRST, then adjust weight parsing
-            unit_detected = self._extract_unit_from_bytes(data)
-            
-            # Now re-parse weight with correct decimal places based on unit
-            if not weight_digits:
-                weight_in_detected_unit = 0.0
-            else:
-                weight_raw = int(weight_digits)
-                
-                # Different units have different decimal precision
-                if unit_detected == "oz":
-                    # Ounces: "020140" → 2.014 oz (divide by 10000)
-                    weight_in_detected_unit = float(weight_raw) / 10000.0
-                else:
-                    # Grams: "000640" → 6.40 g (divide by 100)
-                    weight_in_detected_unit = float(weight_raw) / 100.0
+                weight_raw = int(weight_bytes)
+            except ValueError:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Ignoring packet with invalid weight field: %r", weight_bytes)
+                return None
+
+            # Resolve the unit and its decimal precision, anything else is grams
+            unit_detected, raw_divisor, grams_per_raw = _UNIT_BY_FIELD.get(
+                unit_field, _GRAMS_UNIT
+            )
+            signed_raw = _SIGN_BY_BYTE.get(sign_byte, 1.0) * weight_raw
+            weight_in_detected_unit = signed_raw / raw_divisor
             
-            # Extract battery level from byte 15
-            battery_level = None
-            if len(data) > BATTERY_BYTE_INDEX:
-                battery_byte = data[BATTERY_BYTE_INDEX]
-                battery_level = self._calculate_battery_percentage(battery_byte)
+            battery_level = _BATTERY_PERCENTAGE[battery_byte]
             
             # Convert to grams for consistency
-            weight_grams = self._convert_to_grams(weight_in_detected_unit, unit_detected)
+            weight_grams = signed_raw * grams_per_raw
 
             if abs(weight_grams) > MAX_WEIGHT_GRAMS:
                 _LOGGER.warning("Weight value out of range: %.1fg (max: %dg)", weight_grams, MAX_WEIGHT_GRAMS)
                 return None
 
-            _LOGGER.debug(
-                "Weight parsing: raw_bytes=%s ascii=%s digits=%s -> %.3f%s -> %.1fg (battery: %s%%)",
-                weight_bytes.hex(), weight_str, weight_digits, weight_in_detected_unit, unit_detected, weight_grams, battery_level
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Weight parsing: raw_bytes=%s value=%d -> %.3f%s -> %.1fg (battery: %s%%)",
+                    weight_bytes.hex(), weight_raw, weight_in_detected_unit, unit_detected, weight_grams, battery_level
+                )
 
-            return {
-                "weight": weight_grams,
-                "unit": unit_detected,
-                "raw_weight": weight_in_detected_unit,
-                "battery_level": battery_level
-            }
+            return _DecodedPacket(
+                weight_grams, unit_detected, weight_in_detected_unit, battery_level
+            )
 
-        except (ValueError, IndexError) as err:
+        except (ValueError, IndexError, struct.error) as err:
             _LOGGER.error("Error decoding weight data: %s", err)
             return None
 
@@ -441,13 +559,17 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
         # Reset connection state
         self._client = None
         self._notification_enabled = False
-        self._weight_history.clear()
+        self._last_stable_weight = None
+        self._identical_count = 0
         self._unavailable_logged = False
-        self.data = None
-
-        # Cancel ongoing reconnection and re-register callback
-        if self._reconnect_task and not self._reconnect_task.done():
-            self._reconnect_task.cancel()
+        self._cancel_pending_publish()
+        self._last_payload = None
+        self.data = FelicitaScaleData()
+        # The scale starts with its timer stopped and normal precision
+        self.timer_running = False
+        self.precision_mode = False
+
+        # Re-register callback, advertisements drive the reconnection
         self._register_bluetooth_callback()
 
         self.async_update_listeners()
@@ -460,8 +582,8 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
         self._bluetooth_callback_unload = bluetooth.async_register_callback(
             self.hass,
             self._async_handle_bluetooth_event,
-            {"address": self.address},
-            bluetooth.BluetoothScanningMode.ACTIVE,
+            self.address_matcher,
+            bluetooth.BluetoothScanningMode.PASSIVE,
         )
         
 
@@ -479,8 +601,12 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
     async def async_shutdown(self) -> None:
         """Disconnect from the scale."""
         # Cancel reconnection task and unload callback
+        if self._reconnect_unsub:
+            self._reconnect_unsub()
+            self._reconnect_unsub = None
         if self._reconnect_task and not self._reconnect_task.done():
             self._reconnect_task.cancel()
+        self._cancel_pending_publish()
         if self._bluetooth_callback_unload:
             self._bluetooth_callback_unload()
 
@@ -494,21 +620,24 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
         self._client = None
         self._notification_enabled = False
 
-    async def _send_command(self, command: int) -> bool:
+    async def _send_command(self, command: bytes) -> bool:
         """Send a command to the Felicita scale."""
         try:
-            await self._ensure_connected()
+            # Only take the connect lock when there is no live connection
+            if not (self._client and self._client.is_connected):
+                await self._ensure_connected()
             if not self._client or not self._client.is_connected:
                 _LOGGER.error("Cannot send command: not connected to scale")
                 return False
             
-            command_bytes = bytes([command])
-            await self._client.write_gatt_char(CHARACTERISTIC_UUID, command_bytes)
-            _LOGGER.debug("Sent command 0x%02x to Felicita scale", command)
+            await self._client.write_gatt_char(
+                CHARACTERISTIC_UUID, command, response=self._write_response
+            )
+            _LOGGER.debug("Sent command 0x%02x to Felicita scale", command[0])
             return True
             
         except BleakError as err:
-            _LOGGER.error("Error sending command 0x%02x: %s", command, err)
+            _LOGGER.error("Error sending command 0x%02x: %s", command[0], err)
             return False
 
     async def async_tare(self) -> bool:
@@ -524,12 +653,18 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
     async def async_start_timer(self) -> bool:
         """Start the scale's timer."""
         _LOGGER.info("Starting timer on Felicita scale")
-        return await self._send_command(COMMAND_START_TIMER)
+        if not await self._send_command(COMMAND_START_TIMER):
+            return False
+        self._set_timer_running(True)
+        return True
 
     async def async_stop_timer(self) -> bool:
         """Stop the scale's timer."""
         _LOGGER.info("Stopping timer on Felicita scale")
-        return await self._send_command(COMMAND_STOP_TIMER)
+        if not await self._send_command(COMMAND_STOP_TIMER):
+            return False
+        self._set_timer_running(False)
+        return True
 
     async def async_reset_timer(self) -> bool:
         """Reset the scale's timer to zero."""
@@ -539,10 +674,24 @@ class FelicitaScaleDataUpdateCoordinator(DataUpdateCoordinator[FelicitaScaleData
     async def async_toggle_timer(self) -> bool:
         """Toggle the scale's timer (start/stop)."""
         _LOGGER.info("Toggling timer on Felicita scale")
-        return await self._send_command(COMMAND_TOGGLE_TIMER)
+        if not await self._send_command(COMMAND_TOGGLE_TIMER):
+            return False
+        self._set_timer_running(not self.timer_running)
+        return True
 
     async def async_toggle_precision(self) -> bool:
         """Toggle the scale's precision mode."""
         _LOGGER.info("Toggling precision on Felicita scale")
-        return await self._send_command(COMMAND_TOGGLE_PRECISION)
+        if not await self._send_command(COMMAND_TOGGLE_PRECISION):
+            return False
+        self.precision_mode = not self.precision_mode
+        self.async_update_listeners()
+        return True
+
+    @callback
+    def _set_timer_running(self, running: bool) -> None:
+        """Record the timer state and notify entities if it changed."""
+        if self.timer_running != running:
+            self.timer_running = running
+            self.async_update_listeners()
 
@@ -17,6 +17,7 @@ async def async_get_config_entry_diagnostics(
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
     coordinator = entry.runtime_data
+    data = coordinator.data
 
     return {
         "entry": {
@@ -37,15 +38,11 @@ async def async_get_config_entry_diagnostics(
             "connection_stats": coordinator.connection_stats,
         },
         "data": {
-            "weight": coordinator.data.weight if coordinator.data else None,
-            "unit": coordinator.data.unit if coordinator.data else None,
-            "is_stable": coordinator.data.is_stable if coordinator.data else None,
-            "battery_level": coordinator.data.battery_level if coordinator.data else None,
-            "last_measurement": (
-                coordinator.data.last_measurement.isoformat()
-                if coordinator.data and coordinator.data.last_measurement
-                else None
-            ),
+            "weight": data.weight,
+            "unit": data.unit,
+            "is_stable": data.is_stable,
+            "battery_level": data.battery_level,
+            "last_measurement": data.last_measurement_iso,
         },
     }
 
@@ -0,0 +1,42 @@
+"""Base entity for Felicita Scale integration."""
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import FelicitaScaleDataUpdateCoordinator
+
+
+class FelicitaScaleEntity(CoordinatorEntity[FelicitaScaleDataUpdateCoordinator]):
+    """Base class for Felicita Scale entities."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: FelicitaScaleDataUpdateCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._attr_device_info = coordinator.device_info
+        self._attr_available = self._compute_available()
+
+    def _compute_available(self) -> bool:
+        """Return if the scale is connected."""
+        return (
+            self.coordinator.last_update_success
+            and self.coordinator.is_connected
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self._attr_available
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh availability, the scale may have connected since init."""
+        await super().async_added_to_hass()
+        self._attr_available = self._compute_available()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh availability, it only changes on coordinator updates."""
+        self._attr_available = self._compute_available()
+        super()._handle_coordinator_update()
@@ -1,7 +1,7 @@
 """Data models for Felicita Scale integration."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -13,29 +13,51 @@ if TYPE_CHECKING:
     from .coordinator import FelicitaScaleDataUpdateCoordinator
 
 
-@dataclass
+# Conversion factors between the units the scale reports, resolved once so
+# reads skip MassConverter's unit validation
+_SCALE_UNITS = ("g", "oz")
+_FAST_FACTORS = {
+    (from_unit, to_unit): MassConverter.convert(1.0, from_unit, to_unit)
+    for from_unit in _SCALE_UNITS
+    for to_unit in _SCALE_UNITS
+}
+
+
+@dataclass(slots=True)
 class FelicitaScaleData:
     """Data class for Felicita scale measurements."""
 
     weight: float | None = None  # Weight in grams (normalized)
+    weight_display: float | None = None  # Weight rounded for display
     unit: str = "g"  # Scale's native unit
     raw_weight: float | None = None  # Weight in scale's native unit
     is_stable: bool = False
     battery_level: int | None = None
-    last_measurement: datetime | None = field(default_factory=lambda: datetime.now())
+    last_measurement: datetime | None = None
+    last_measurement_iso: str | None = None  # Formatted once per measurement
 
 
     def update_weight(self, weight: float, is_stable: bool = False) -> None:
         """Update weight measurement."""
         self.weight = weight
+        self.weight_display = round(weight, 1)
         self.is_stable = is_stable
-        self.last_measurement = datetime.now()
+        self.set_last_measurement(datetime.now())
+
+    def set_last_measurement(self, when: datetime) -> None:
+        """Record the measurement time and its ISO form."""
+        self.last_measurement = when
+        self.last_measurement_iso = when.isoformat()
 
     def get_weight_in_unit(self, target_unit: str) -> float | None:
         """Get weight converted to target unit using Home Assistant's converter."""
         if self.weight is None:
             return None
 
+        factor = _FAST_FACTORS.get((self.unit, target_unit))
+        if factor is not None:
+            return self.weight * factor
+
         try:
             return MassConverter.convert(self.weight, self.unit, target_unit)
         except ValueError:
@@ -14,17 +14,17 @@ from homeassistant.const import CONF_ADDRESS, UnitOfMass, UnitOfVolume
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import FelicitaScaleDataUpdateCoordinator
+from .entity import FelicitaScaleEntity
 from .models import FelicitaScaleConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0  # No limit since coordinator manages all updates
 
-SENSOR_DESCRIPTIONS = [
+SENSOR_DESCRIPTIONS = (
     SensorEntityDescription(
         key="weight",
         translation_key="weight",
@@ -39,7 +39,8 @@ SENSOR_DESCRIPTIONS = [
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement="%",
     ),
-]
+)
+SENSOR_DESCRIPTIONS_BY_KEY = {desc.key: desc for desc in SENSOR_DESCRIPTIONS}
 
 
 async def async_setup_entry(
@@ -50,23 +51,19 @@ async def async_setup_entry(
     """Set up Felicita Scale sensor based on a config entry."""
     coordinator = config_entry.runtime_data
 
-    entities = []
-    
-    # Add weight sensor
-    weight_desc = next(desc for desc in SENSOR_DESCRIPTIONS if desc.key == "weight")
-    entities.append(FelicitaScaleWeightSensor(coordinator, config_entry, weight_desc))
-    
-    # Add battery sensor
-    battery_desc = next(desc for desc in SENSOR_DESCRIPTIONS if desc.key == "battery")
-    entities.append(FelicitaScaleBatterySensor(coordinator, config_entry, battery_desc))
-
-    async_add_entities(entities)
+    async_add_entities([
+        FelicitaScaleWeightSensor(
+            coordinator, config_entry, SENSOR_DESCRIPTIONS_BY_KEY["weight"]
+        ),
+        FelicitaScaleBatterySensor(
+            coordinator, config_entry, SENSOR_DESCRIPTIONS_BY_KEY["battery"]
+        ),
+    ])
 
 
-class FelicitaScaleWeightSensor(CoordinatorEntity[FelicitaScaleDataUpdateCoordinator], SensorEntity):
+class FelicitaScaleWeightSensor(FelicitaScaleEntity, SensorEntity):
     """Weight sensor for Felicita Scale."""
 
-    _attr_has_entity_name = True
     _attr_should_poll = False
     _unrecorded_attributes = frozenset({"scale_unit", "raw_weight", "is_stable", "last_measurement"})
 
@@ -83,53 +80,37 @@ class FelicitaScaleWeightSensor(CoordinatorEntity[FelicitaScaleDataUpdateCoordin
         self._address = config_entry.data[CONF_ADDRESS]
         self._attr_unique_id = f"{self._address}_weight"
         self._attr_name = "Weight"
-        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
         """Return the weight value in grams."""
-        if not self.coordinator.data:
-            return None
+        return self.coordinator.data.weight_display
 
-        return round(self.coordinator.data.weight, 1) if self.coordinator.data.weight is not None else None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
+    def _compute_available(self) -> bool:
+        """Return if the scale is connected and has reported a weight."""
         return (
-            super().available
-            and self.coordinator.data is not None
-            and self.coordinator.is_connected
+            super()._compute_available()
+            and self.coordinator.data.weight is not None
         )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes."""
-        if not self.coordinator.data:
-            return None
-
-        attributes = {}
-
-        # Show the scale's native unit and raw value
-        if hasattr(self.coordinator.data, 'unit') and self.coordinator.data.unit:
-            attributes["scale_unit"] = self.coordinator.data.unit
-            
-        if hasattr(self.coordinator.data, 'raw_weight') and self.coordinator.data.raw_weight is not None:
-            attributes["raw_weight"] = self.coordinator.data.raw_weight
-
-        if self.coordinator.data.is_stable is not None:
-            attributes["is_stable"] = self.coordinator.data.is_stable
-
-        if self.coordinator.data.last_measurement is not None:
-            attributes["last_measurement"] = self.coordinator.data.last_measurement.isoformat()
-
-        return attributes if attributes else None
+        data = self.coordinator.data
+
+        # Show the scale's native unit and raw value alongside the state
+        attributes = (
+            ("scale_unit", data.unit),
+            ("raw_weight", data.raw_weight),
+            ("is_stable", data.is_stable),
+            ("last_measurement", data.last_measurement_iso),
+        )
+        return {key: value for key, value in attributes if value is not None} or None
 
 
-class FelicitaScaleBatterySensor(CoordinatorEntity[FelicitaScaleDataUpdateCoordinator], SensorEntity):
+class FelicitaScaleBatterySensor(FelicitaScaleEntity, SensorEntity):
     """Battery sensor for Felicita Scale."""
 
-    _attr_has_entity_name = True
     _attr_should_poll = False
 
     def __init__(
@@ -145,23 +126,15 @@ class FelicitaScaleBatterySensor(CoordinatorEntity[FelicitaScaleDataUpdateCoordi
         self._address = config_entry.data[CONF_ADDRESS]
         self._attr_unique_id = f"{self._address}_battery"
         self._attr_name = "Battery"
-        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> int | None:
         """Return the battery level."""
-        if not self.coordinator.data:
-            return None
-
         return self.coordinator.data.battery_level
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
+    def _compute_available(self) -> bool:
+        """Return if the scale is connected and has reported its battery."""
         return (
-            super().available
-            and self.coordinator.data is not None
+            super()._compute_available()
             and self.coordinator.data.battery_level is not None
-            and self.coordinator.is_connected
         )
-